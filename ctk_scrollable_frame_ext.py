@@ -22,7 +22,7 @@ Usage:
     # Change anchor at runtime:
     frame.configure(content_anchor="se")
     
-    # Mudar tema em tempo real (agora funciona):
+    # Mudar tema em tempo real:
     ctk.set_appearance_mode("dark")  # a cor do canvas será atualizada automaticamente
 """
 
@@ -45,8 +45,31 @@ _ANCHOR_POSITION: dict[str, tuple[float, float]] = {
     "se":     (1.0, 1.0),
 }
 
+# ── Anchor → per-axis offset rule, so resizes need only integer math ────────
+_START, _MID, _END = 0, 1, 2
+_ANCHOR_OPS: dict[str, tuple[int, int]] = {
+    name: ({0.0: _START, 0.5: _MID, 1.0: _END}[rx],
+           {0.0: _START, 0.5: _MID, 1.0: _END}[ry])
+    for name, (rx, ry) in _ANCHOR_POSITION.items()
+}
+
 _VALID_ANCHORS = list(_ANCHOR_POSITION.keys())
 _VALID_ORIENTATIONS = ("vertical", "horizontal", "both")
+_WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+_SHIFT_MASK = 0x0001  # Shift bit of tkinter's event.state
+_ANCESTRY_CACHE_LIMIT = 512  # entries kept by _is_child_of_canvas before reset
+
+
+class _SyncedCTkFrame(ctk.CTkFrame):
+    """CTkFrame that reports color redraws (theme switch, fg/bg_color change)."""
+
+    _on_color_redraw = None
+
+    def _draw(self, no_color_updates=False):
+        super()._draw(no_color_updates)
+        # Resize redraws pass no_color_updates=True and are skipped
+        if not no_color_updates and self._on_color_redraw is not None:
+            self._on_color_redraw()
 
 
 class CTkScrollableFrameExt(tkinter.Frame):
@@ -96,15 +119,25 @@ class CTkScrollableFrameExt(tkinter.Frame):
 
         self._orientation = orientation
         self._content_anchor = anchor
+        self._anchor_ops = _ANCHOR_OPS[anchor]
+        self._last_anchor_state = None  # (cw, ch, fw, fh, ops) of the last applied layout
+        self._apply_pending = None  # after_idle id while a layout flush is queued
+        self._pending_canvas_event = None  # (width, height) of the latest canvas <Configure>
+        self._last_item_w = None  # width/height last forced on the canvas window item
+        self._last_item_h = None
+        self._ancestry_cache: dict[str, bool] = {}  # Tk path name → is inside our canvas
+        self._can_scroll_x = False  # scrollregion wider than the canvas
+        self._can_scroll_y = False  # scrollregion taller than the canvas
+        self._last_grid_sig = None  # (orientation, padding, label shown) of the current layout
+        self._current_bg = None  # color last applied by _sync_bg
         self._desired_width = width
         self._desired_height = height
-        self._shift_pressed = False
+        self._wheel_funcids: Optional[list[tuple[str, str]]] = None  # set while hovered
         self._label_text = label_text
         self._destroying = False  # anti-recursion flag for destroy
-        self._theme_update_scheduled = False  # Evita múltiplas atualizações de tema
 
         # ── Outer frame (border + background color) ───────────────────────────
-        self._parent_frame = ctk.CTkFrame(
+        self._parent_frame = _SyncedCTkFrame(
             master=master, width=0, height=0,
             corner_radius=corner_radius, border_width=border_width,
             bg_color=bg_color, fg_color=fg_color, border_color=border_color,
@@ -116,6 +149,17 @@ class CTkScrollableFrameExt(tkinter.Frame):
         )
         self._set_scroll_increments()
 
+        # Platform and orientation never change for an instance, so the wheel
+        # handler is resolved once here instead of branching on every tick.
+        if sys.platform.startswith("win"):
+            self._compute_delta = self._delta_win
+        elif sys.platform == "darwin":
+            self._compute_delta = self._delta_mac
+        else:
+            self._compute_delta = self._delta_x11
+
+        self._dispatch_wheel = self._make_wheel_dispatch(orientation, self._compute_delta)
+
         # ── Scrollbar(s) ─────────────────────────────────────────────────────
         self._scrollbar: Optional[ctk.CTkScrollbar] = None
         self._scrollbar_x: Optional[ctk.CTkScrollbar] = None
@@ -155,15 +199,11 @@ class CTkScrollableFrameExt(tkinter.Frame):
             )
 
         # ── Optional top label ───────────────────────────────────────────────
-        self._label = ctk.CTkLabel(
-            self._parent_frame, text=label_text, anchor=label_anchor,
-            font=label_font,
-            corner_radius=self._parent_frame.cget("corner_radius"),
-            text_color=label_text_color,
-            fg_color=(
-                ctk.ThemeManager.theme["CTkScrollableFrame"]["label_fg_color"]
-                if label_fg_color is None else label_fg_color
-            ),
+        # Built by _create_grid once there is text to show (see _get_label).
+        self._label: Optional[ctk.CTkLabel] = None
+        self._label_kw = dict(
+            anchor=label_anchor, font=label_font,
+            text_color=label_text_color, fg_color=label_fg_color,
         )
 
         # ── Inner frame (where the user adds widgets) ─────────────────────────
@@ -185,50 +225,27 @@ class CTkScrollableFrameExt(tkinter.Frame):
         self.bind("<Configure>", self._on_frame_configure)
         self._parent_canvas.bind("<Configure>", self._on_canvas_configure)
 
-        self.bind_all("<MouseWheel>",         self._mouse_wheel_all,            add="+")
-        self.bind_all("<Button-4>",           self._mouse_wheel_all,            add="+")
-        self.bind_all("<Button-5>",           self._mouse_wheel_all,            add="+")
-        self.bind_all("<KeyPress-Shift_L>",   self._keyboard_shift_press_all,   add="+")
-        self.bind_all("<KeyPress-Shift_R>",   self._keyboard_shift_press_all,   add="+")
-        self.bind_all("<KeyRelease-Shift_L>", self._keyboard_shift_release_all, add="+")
-        self.bind_all("<KeyRelease-Shift_R>", self._keyboard_shift_release_all, add="+")
+        # Wheel events are only routed to this instance while the pointer is
+        # over it; tkinter.Frame.bind skips CTkFrame's bind override, which
+        # would attach to its internal drawing canvas instead.
+        tkinter.Frame.bind(self._parent_frame, "<Enter>", self._on_pointer_enter, add="+")
+        tkinter.Frame.bind(self._parent_frame, "<Leave>", self._on_pointer_leave, add="+")
 
-        # ── Monitorar mudanças de tema ───────────────────────────────────────
-        # Verifica a cada 100ms se o tema mudou (método utilizado pelo CustomTkinter)
-        self._schedule_theme_check()
+        # ── Theme changes ────────────────────────────────────────────────────
+        # The outer frame redraws its colors on every appearance mode switch
+        # and fg/bg_color change (including a CTk master pushing bg_color onto
+        # it), so following its redraws replaces polling on a timer.
+        self._parent_frame._on_color_redraw = self._on_frame_color_redraw
+        self._parent_frame.bind("<<ThemeChanged>>",
+                                lambda e: self._on_frame_color_redraw(), add="+")
 
     # ══════════════════════════════════════════════════════════════════════════
-    # Theme monitoring (NEW)
+    # Theme monitoring
     # ══════════════════════════════════════════════════════════════════════════
 
-    def _schedule_theme_check(self):
-        """Agenda uma verificação de mudança de tema."""
+    def _on_frame_color_redraw(self):
+        """Called after the outer CTkFrame redraws with new colors."""
         if not self._destroying:
-            try:
-                self._check_theme_changed()
-                self.after(100, self._schedule_theme_check)
-            except tkinter.TclError:
-                pass  # Widget foi destruído
-
-    def _check_theme_changed(self):
-        """Verifica se o tema mudou e sincroniza as cores se necessário."""
-        # Pega a cor atual do CTkFrame (que responde a mudanças de tema)
-        current_fg = self._parent_frame.cget("fg_color")
-        
-        # Compara com a cor armazenada no canvas
-        canvas_color = self._parent_canvas.cget("bg")
-        
-        # Converte a cor do CTkFrame para o formato esperado
-        expected_color = self._parent_frame.cget("bg_color")
-        if expected_color == "transparent":
-            expected_color = current_fg
-        
-        if isinstance(expected_color, (list, tuple)):
-            mode = ctk.get_appearance_mode()
-            expected_color = expected_color[0] if mode == "Light" else expected_color[1]
-        
-        # Se as cores não correspondem, sincroniza
-        if canvas_color != expected_color:
             self._sync_bg()
 
     # ══════════════════════════════════════════════════════════════════════════
@@ -239,8 +256,9 @@ class CTkScrollableFrameExt(tkinter.Frame):
         """
         Correct destruction order:
           1. Set the flag to block re-entrance.
-          2. Destroy the inner frame (self) directly via tkinter.
-          3. Destroy the outer frame (which contains canvas + scrollbars + label).
+          2. Release global bindings, the redraw hook and pending idle work.
+          3. Destroy the inner frame (self) directly via tkinter.
+          4. Destroy the outer frame (which contains canvas + scrollbars + label).
 
         Without the flag, tkinter walks the _parent_frame children tree,
         finds the canvas, which contains the inner frame, which calls destroy()
@@ -250,6 +268,18 @@ class CTkScrollableFrameExt(tkinter.Frame):
             return
         self._destroying = True
 
+        # Drop our global wheel scripts (present if destroyed while hovered)
+        self._unbind_wheel()
+        self._parent_frame._on_color_redraw = None
+        self._ancestry_cache.clear()
+
+        if self._apply_pending is not None:
+            try:
+                self.after_cancel(self._apply_pending)
+            except tkinter.TclError:
+                pass
+            self._apply_pending = None
+
         # Destroy the inner frame (tkinter.Frame base) without calling our destroy
         try:
             tkinter.Frame.destroy(self)
@@ -275,14 +305,22 @@ class CTkScrollableFrameExt(tkinter.Frame):
             mode = ctk.get_appearance_mode()
             color = color[0] if mode == "Light" else color[1]
 
+        if color == self._current_bg:
+            return
         tkinter.Frame.configure(self, bg=color)
         self._parent_canvas.configure(bg=color)
+        self._current_bg = color
 
     def _create_grid(self):
         cr = self._parent_frame.cget("corner_radius") or 0
         bw = self._parent_frame.cget("border_width") or 0
         sp = int(cr + bw)
 
+        sig = (self._orientation, sp, bool(self._label_text))
+        if sig == self._last_grid_sig:
+            return  # layout unchanged: skip the grid/rowconfigure round-trips
+        self._last_grid_sig = sig
+
         if self._orientation == "horizontal":
             self._parent_frame.grid_columnconfigure(0, weight=1)
             self._parent_frame.grid_rowconfigure(1, weight=1)
@@ -290,8 +328,8 @@ class CTkScrollableFrameExt(tkinter.Frame):
                                      padx=sp, pady=(sp, 0))
             self._scrollbar.grid(row=2, column=0, sticky="ew", padx=sp)
             if self._label_text:
-                self._label.grid(row=0, column=0, sticky="ew", padx=sp, pady=sp)
-            else:
+                self._get_label().grid(row=0, column=0, sticky="ew", padx=sp, pady=sp)
+            elif self._label is not None:
                 self._label.grid_forget()
 
         elif self._orientation == "vertical":
@@ -301,9 +339,9 @@ class CTkScrollableFrameExt(tkinter.Frame):
                                      padx=(sp, 0), pady=sp)
             self._scrollbar.grid(row=1, column=1, sticky="ns", pady=sp)
             if self._label_text:
-                self._label.grid(row=0, column=0, columnspan=2,
-                                 sticky="ew", padx=sp, pady=sp)
-            else:
+                self._get_label().grid(row=0, column=0, columnspan=2,
+                                       sticky="ew", padx=sp, pady=sp)
+            elif self._label is not None:
                 self._label.grid_forget()
 
         elif self._orientation == "both":
@@ -315,41 +353,107 @@ class CTkScrollableFrameExt(tkinter.Frame):
             self._scrollbar.grid(row=1, column=1, sticky="ns", pady=(sp, 0))
             self._scrollbar_x.grid(row=2, column=0, sticky="ew", padx=(sp, 0))
             if self._label_text:
-                self._label.grid(row=0, column=0, columnspan=2,
-                                 sticky="ew", padx=sp, pady=sp)
-            else:
+                self._get_label().grid(row=0, column=0, columnspan=2,
+                                       sticky="ew", padx=sp, pady=sp)
+            elif self._label is not None:
                 self._label.grid_forget()
 
+    def _get_label(self) -> ctk.CTkLabel:
+        """Create the top label on first use."""
+        if self._label is None:
+            kw = self._label_kw
+            self._label = ctk.CTkLabel(
+                self._parent_frame, text=self._label_text, anchor=kw["anchor"],
+                font=kw["font"],
+                corner_radius=self._parent_frame.cget("corner_radius"),
+                text_color=kw["text_color"],
+                fg_color=(
+                    ctk.ThemeManager.theme["CTkScrollableFrame"]["label_fg_color"]
+                    if kw["fg_color"] is None else kw["fg_color"]
+                ),
+            )
+        return self._label
+
+    def _configure_label(self, option: str, value):
+        if self._label is None:
+            self._label_kw[option] = value  # applied when the label is created
+        else:
+            self._label.configure(**{option: value})
+
+    def _cget_label(self, option: str):
+        if self._label is not None:
+            return self._label.cget(option)
+        # No label yet: answer from the pending options without creating it
+        value = self._label_kw[option]
+        if option == "fg_color" and value is None:
+            return ctk.ThemeManager.theme["CTkScrollableFrame"]["label_fg_color"]
+        return value
+
     # ── Anchor ───────────────────────────────────────────────────────────────
 
     def _apply_content_anchor(self):
-        """Reposition the inner frame according to content_anchor."""
+        """
+        Compute the inner frame position according to content_anchor.
+
+        Returns ((x, y), scrollregion) for _flush_apply to write back-to-back,
+        or None when nothing changed since the last call.
+        """
         cw = self._parent_canvas.winfo_width()
         ch = self._parent_canvas.winfo_height()
         fw = self.winfo_width()
         fh = self.winfo_height()
 
-        rx, ry = _ANCHOR_POSITION[self._content_anchor]
-        x = max(0, int((cw - fw) * rx))
-        y = max(0, int((ch - fh) * ry))
+        state = (cw, ch, fw, fh, self._anchor_ops)
+        if state == self._last_anchor_state:
+            return None  # nothing moved: skip the coords/scrollregion round-trips
+        self._last_anchor_state = state
 
-        self._parent_canvas.coords(self._create_window_id, x, y)
+        xop, yop = self._anchor_ops
+        x = 0 if xop == _START else max(0, cw - fw if xop == _END else (cw - fw) >> 1)
+        y = 0 if yop == _START else max(0, ch - fh if yop == _END else (ch - fh) >> 1)
 
         sr_w = max(fw + x, cw)
         sr_h = max(fh + y, ch)
-        self._parent_canvas.configure(scrollregion=(0, 0, sr_w, sr_h))
+        self._can_scroll_x = sr_w > cw
+        self._can_scroll_y = sr_h > ch
+        return (x, y), (0, 0, sr_w, sr_h)
+
+    def _schedule_apply(self):
+        """Coalesce bursts of <Configure> events into one flush per idle cycle."""
+        if self._apply_pending is None and not self._destroying:
+            self._apply_pending = self.after_idle(self._flush_apply)
+
+    def _flush_apply(self):
+        self._apply_pending = None
+        if self._destroying:
+            return
+
+        if self._pending_canvas_event is not None:
+            width, height = self._pending_canvas_event
+            self._pending_canvas_event = None
+            if self._orientation == "horizontal":
+                if height != self._last_item_h:
+                    self._parent_canvas.itemconfigure(
+                        self._create_window_id, height=height)
+                    self._last_item_h = height
+            elif self._orientation == "vertical":
+                if width != self._last_item_w:
+                    self._parent_canvas.itemconfigure(
+                        self._create_window_id, width=width)
+                    self._last_item_w = width
+
+        layout = self._apply_content_anchor()
+        if layout is not None:
+            coords, sr = layout
+            self._parent_canvas.coords(self._create_window_id, *coords)
+            self._parent_canvas.configure(scrollregion=sr)
 
     def _on_frame_configure(self, event=None):
-        self._apply_content_anchor()
+        self._schedule_apply()
 
     def _on_canvas_configure(self, event):
-        if self._orientation == "horizontal":
-            self._parent_canvas.itemconfigure(
-                self._create_window_id, height=event.height)
-        elif self._orientation == "vertical":
-            self._parent_canvas.itemconfigure(
-                self._create_window_id, width=event.width)
-        self._apply_content_anchor()
+        self._pending_canvas_event = (event.width, event.height)
+        self._schedule_apply()
 
     # ── Scrolling ────────────────────────────────────────────────────────────
 
@@ -359,133 +463,241 @@ class CTkScrollableFrameExt(tkinter.Frame):
         elif sys.platform == "darwin":
             self._parent_canvas.configure(xscrollincrement=4, yscrollincrement=8)
 
+    @staticmethod
+    def _delta_win(event) -> int:
+        return -int(event.delta / 6)
+
+    @staticmethod
+    def _delta_mac(event) -> int:
+        return -event.delta
+
+    @staticmethod
+    def _delta_x11(event) -> int:
+        return -2 if event.num == 4 else 2
+
+    def _wheel_both(self, delta: int, shift: int):
+        if shift:
+            if self._can_scroll_x:
+                self._parent_canvas.xview("scroll", delta, "units")
+        else:
+            if self._can_scroll_y:
+                self._parent_canvas.yview("scroll", delta, "units")
+
+    def _wheel_vertical(self, delta: int):
+        if self._can_scroll_y:
+            self._parent_canvas.yview("scroll", delta, "units")
+
+    def _wheel_horizontal(self, delta: int):
+        if self._can_scroll_x:
+            self._parent_canvas.xview("scroll", delta, "units")
+
+    def _make_wheel_dispatch(self, orientation: str, compute_delta):
+        """Return an event handler specialised for the given orientation."""
+        if orientation == "vertical":
+            wheel_vertical = self._wheel_vertical
+            return lambda event: wheel_vertical(compute_delta(event))
+        if orientation == "horizontal":
+            wheel_horizontal = self._wheel_horizontal
+            return lambda event: wheel_horizontal(compute_delta(event))
+        wheel_both = self._wheel_both
+        return lambda event: wheel_both(compute_delta(event), event.state & _SHIFT_MASK)
+
     def _mouse_wheel_all(self, event):
         if not self._is_child_of_canvas(event.widget):
             return
+        self._dispatch_wheel(event)
 
-        if sys.platform.startswith("win"):
-            delta = -int(event.delta / 6)
-        elif sys.platform == "darwin":
-            delta = -event.delta
-        else:
-            delta = -2 if event.num == 4 else 2
-
-        if self._orientation == "both":
-            if self._shift_pressed:
-                if self._parent_canvas.xview() != (0.0, 1.0):
-                    self._parent_canvas.xview("scroll", delta, "units")
-            else:
-                if self._parent_canvas.yview() != (0.0, 1.0):
-                    self._parent_canvas.yview("scroll", delta, "units")
-        elif self._orientation == "vertical":
-            if self._parent_canvas.yview() != (0.0, 1.0):
-                self._parent_canvas.yview("scroll", delta, "units")
-        elif self._orientation == "horizontal":
-            if self._parent_canvas.xview() != (0.0, 1.0):
-                self._parent_canvas.xview("scroll", delta, "units")
+    def _bind_wheel(self):
+        if self._wheel_funcids is not None or self._destroying:
+            return
+        self._wheel_funcids = [
+            (seq, self.bind_all(seq, self._mouse_wheel_all, add="+"))
+            for seq in _WHEEL_SEQUENCES
+        ]
+
+    def _unbind_wheel(self):
+        """Remove only our own scripts from the "all" tag, leaving others intact."""
+        if self._wheel_funcids is None:
+            return
+        for seq, funcid in self._wheel_funcids:
+            try:
+                script = self.tk.call("bind", "all", seq)
+                # Match the exact prefix tkinter writes (as Misc._unbind does in
+                # 3.13); a plain substring test could hit another instance's id.
+                prefix = f'if {{"[{funcid} '
+                kept = [line for line in script.split("\n") if not line.startswith(prefix)]
+                self.tk.call("bind", "all", seq, "\n".join(kept))
+                self.deletecommand(funcid)
+            except tkinter.TclError:
+                pass
+        self._wheel_funcids = None
 
-    def _keyboard_shift_press_all(self, event):
-        self._shift_pressed = True
+    def _on_pointer_enter(self, event):
+        self._bind_wheel()
 
-    def _keyboard_shift_release_all(self, event):
-        self._shift_pressed = False
+    def _on_pointer_leave(self, event):
+        # <Leave> also fires when the pointer moves onto a child widget
+        try:
+            w = self._parent_frame.winfo_containing(event.x_root, event.y_root)
+        except (KeyError, tkinter.TclError):
+            w = None
+        while w is not None:
+            if w is self._parent_frame:
+                return
+            w = getattr(w, "master", None)
+        self._unbind_wheel()
 
     def _is_child_of_canvas(self, widget):
-        if widget == self._parent_canvas:
-            return True
-        try:
-            return self._is_child_of_canvas(widget.master)
-        except AttributeError:
-            return False
+        # Tk path names come from per-master counters and are never reused,
+        # unlike id(), so a cached answer cannot belong to a newer widget.
+        cache = self._ancestry_cache
+        wid = str(widget)
+        hit = cache.get(wid)
+        if hit is not None:
+            return hit
+
+        if len(cache) >= _ANCESTRY_CACHE_LIMIT:
+            cache.clear()
+
+        target = self._parent_canvas
+        w = widget
+        while w is not None:
+            if w is target:
+                cache[wid] = True
+                return True
+            w = getattr(w, "master", None)
+
+        cache[wid] = False
+        return False
 
     # ══════════════════════════════════════════════════════════════════════════
     # Public API
     # ══════════════════════════════════════════════════════════════════════════
 
-    def configure(self, **kwargs):
-        if "content_anchor" in kwargs:
-            anchor = kwargs.pop("content_anchor").lower()
-            if anchor not in _ANCHOR_POSITION:
-                raise ValueError(f"Invalid content_anchor: '{anchor}'. Use: {_VALID_ANCHORS}")
-            self._content_anchor = anchor
-            self._apply_content_anchor()
+    # ── configure() handlers, one per extended option ─────────────────────────
 
-        if "width" in kwargs:
-            self._desired_width = kwargs.pop("width")
-            self._parent_canvas.configure(width=self._desired_width)
+    def _set_content_anchor(self, value):
+        anchor = value.lower()  # validated by configure()
+        self._content_anchor = anchor
+        self._anchor_ops = _ANCHOR_OPS[anchor]
+        self._schedule_apply()
 
-        if "height" in kwargs:
-            self._desired_height = kwargs.pop("height")
-            self._parent_canvas.configure(height=self._desired_height)
+    def _set_width(self, value):
+        self._desired_width = value
+        self._parent_canvas.configure(width=value)
 
-        if "corner_radius" in kwargs:
-            self._parent_frame.configure(corner_radius=kwargs.pop("corner_radius"))
-            self._create_grid()
+    def _set_height(self, value):
+        self._desired_height = value
+        self._parent_canvas.configure(height=value)
 
-        if "border_width" in kwargs:
-            self._parent_frame.configure(border_width=kwargs.pop("border_width"))
-            self._create_grid()
+    def _set_corner_radius(self, value):
+        self._parent_frame.configure(corner_radius=value)
 
-        if "fg_color" in kwargs:
-            self._parent_frame.configure(fg_color=kwargs.pop("fg_color"))
-            self._sync_bg()
-            for child in self.winfo_children():
-                if isinstance(child, ctk.CTkBaseClass):
-                    child.configure(bg_color=self._parent_frame.cget("fg_color"))
-
-        if "scrollbar_fg_color" in kwargs:
-            v = kwargs.pop("scrollbar_fg_color")
-            self._scrollbar.configure(fg_color=v)
-            if self._scrollbar_x:
-                self._scrollbar_x.configure(fg_color=v)
-
-        if "scrollbar_button_color" in kwargs:
-            v = kwargs.pop("scrollbar_button_color")
-            self._scrollbar.configure(button_color=v)
-            if self._scrollbar_x:
-                self._scrollbar_x.configure(button_color=v)
-
-        if "scrollbar_button_hover_color" in kwargs:
-            v = kwargs.pop("scrollbar_button_hover_color")
-            self._scrollbar.configure(button_hover_color=v)
-            if self._scrollbar_x:
-                self._scrollbar_x.configure(button_hover_color=v)
-
-        if "label_text" in kwargs:
-            self._label_text = kwargs.pop("label_text")
-            self._label.configure(text=self._label_text)
-            self._create_grid()
+    def _set_border_width(self, value):
+        self._parent_frame.configure(border_width=value)
 
-        if "label_font" in kwargs:
-            self._label.configure(font=kwargs.pop("label_font"))
+    def _set_fg_color(self, value):
+        self._parent_frame.configure(fg_color=value)  # redraw hook runs _sync_bg
+        # self.children is tkinter's own registry: no winfo_children() round-trip
+        fg = self._parent_frame.cget("fg_color")
+        for child in list(self.children.values()):
+            if isinstance(child, ctk.CTkBaseClass):
+                child.configure(bg_color=fg)
+
+    def _set_scrollbar_fg_color(self, value):
+        self._scrollbar.configure(fg_color=value)
+        if self._scrollbar_x:
+            self._scrollbar_x.configure(fg_color=value)
+
+    def _set_scrollbar_button_color(self, value):
+        self._scrollbar.configure(button_color=value)
+        if self._scrollbar_x:
+            self._scrollbar_x.configure(button_color=value)
+
+    def _set_scrollbar_button_hover_color(self, value):
+        self._scrollbar.configure(button_hover_color=value)
+        if self._scrollbar_x:
+            self._scrollbar_x.configure(button_hover_color=value)
+
+    def _set_label_text(self, value):
+        self._label_text = value
+        if self._label is not None:
+            self._label.configure(text=value)
+
+    def _set_label_font(self, value):
+        self._configure_label("font", value)
+
+    def _set_label_text_color(self, value):
+        self._configure_label("text_color", value)
+
+    def _set_label_fg_color(self, value):
+        self._configure_label("fg_color", value)
+
+    def _set_label_anchor(self, value):
+        self._configure_label("anchor", value)
+
+    _CONFIG_HANDLERS = {
+        "content_anchor":               _set_content_anchor,
+        "width":                        _set_width,
+        "height":                       _set_height,
+        "corner_radius":                _set_corner_radius,
+        "border_width":                 _set_border_width,
+        "fg_color":                     _set_fg_color,
+        "scrollbar_fg_color":           _set_scrollbar_fg_color,
+        "scrollbar_button_color":       _set_scrollbar_button_color,
+        "scrollbar_button_hover_color": _set_scrollbar_button_hover_color,
+        "label_text":                   _set_label_text,
+        "label_font":                   _set_label_font,
+        "label_text_color":             _set_label_text_color,
+        "label_fg_color":               _set_label_fg_color,
+        "label_anchor":                 _set_label_anchor,
+    }
+
+    # Options that change the grid layout; _create_grid runs once per configure()
+    _LAYOUT_KEYS = frozenset({"corner_radius", "border_width", "label_text"})
 
-        if "label_text_color" in kwargs:
-            self._label.configure(text_color=kwargs.pop("label_text_color"))
+    def configure(self, **kwargs):
+        # Validate up front so a bad value leaves the widget untouched
+        if "content_anchor" in kwargs:
+            anchor = kwargs["content_anchor"].lower()
+            if anchor not in _ANCHOR_POSITION:
+                raise ValueError(f"Invalid content_anchor: '{anchor}'. Use: {_VALID_ANCHORS}")
 
-        if "label_fg_color" in kwargs:
-            self._label.configure(fg_color=kwargs.pop("label_fg_color"))
+        need_grid = False
+        for key in list(kwargs):
+            handler = self._CONFIG_HANDLERS.get(key)
+            if handler is None:
+                continue
+            handler(self, kwargs.pop(key))
+            if key in self._LAYOUT_KEYS:
+                need_grid = True
 
-        if "label_anchor" in kwargs:
-            self._label.configure(anchor=kwargs.pop("label_anchor"))
+        if need_grid:
+            self._create_grid()
 
         if kwargs:
             self._parent_frame.configure(**kwargs)
 
+    _CGET_HANDLERS = {
+        "width":                        lambda s: s._desired_width,
+        "height":                       lambda s: s._desired_height,
+        "content_anchor":               lambda s: s._content_anchor,
+        "orientation":                  lambda s: s._orientation,
+        "label_text":                   lambda s: s._label_text,
+        "label_font":                   lambda s: s._cget_label("font"),
+        "label_text_color":             lambda s: s._cget_label("text_color"),
+        "label_fg_color":               lambda s: s._cget_label("fg_color"),
+        "label_anchor":                 lambda s: s._cget_label("anchor"),
+        "scrollbar_fg_color":           lambda s: s._scrollbar.cget("fg_color"),
+        "scrollbar_button_color":       lambda s: s._scrollbar.cget("button_color"),
+        "scrollbar_button_hover_color": lambda s: s._scrollbar.cget("button_hover_color"),
+    }
+
     def cget(self, attribute_name: str):
-        match attribute_name:
-            case "width":                        return self._desired_width
-            case "height":                       return self._desired_height
-            case "content_anchor":               return self._content_anchor
-            case "orientation":                  return self._orientation
-            case "label_text":                   return self._label_text
-            case "label_font":                   return self._label.cget("font")
-            case "label_text_color":             return self._label.cget("text_color")
-            case "label_fg_color":               return self._label.cget("fg_color")
-            case "label_anchor":                 return self._label.cget("anchor")
-            case "scrollbar_fg_color":           return self._scrollbar.cget("fg_color")
-            case "scrollbar_button_color":       return self._scrollbar.cget("button_color")
-            case "scrollbar_button_hover_color": return self._scrollbar.cget("button_hover_color")
-            case _:                              return self._parent_frame.cget(attribute_name)
+        handler = self._CGET_HANDLERS.get(attribute_name)
+        if handler is not None:
+            return handler(self)
+        return self._parent_frame.cget(attribute_name)
 
     # ── Geometry proxies (delegated to the outer frame) ───────────────────────
 
@@ -5,6 +5,7 @@ Demonstration of CTkScrollableFrameExt with interactive controls
 to test orientation and content_anchor in real-time.
 """
 
+import tkinter
 import customtkinter as ctk
 from ctk_scrollable_frame_ext import CTkScrollableFrameExt
 
@@ -72,8 +73,16 @@ ctk.CTkLabel(
 
 # ── Cache ─────────────────────────────────────────────────────────────────────
 HEADER_FONT = ctk.CTkFont(weight="bold")
+CELL_FONT = ctk.CTkFont()
 PALETTE = ("#2a2a3e", "#252538")
-
+CELL_WIDTH = 90  # same for headers and cells so the columns line up
+# Plain labels are not themed by CTk, so resolve the theme's text color here
+CELL_TEXT_COLOR = ctk.ThemeManager.theme["CTkLabel"]["text_color"][
+    0 if ctk.get_appearance_mode() == "Light" else 1
+]
+
+# Pool entries are [widget, last_text, last_color, last_cell] so populate()
+# only issues configure()/grid() when something actually changed.
 _headers = []
 _cells = []
 
@@ -83,38 +92,61 @@ def populate():
 
     for c in range(cols):
         if c < len(_headers):
-            lbl = _headers[c]
+            entry = _headers[c]
         else:
-            lbl = ctk.CTkLabel(
+            entry = [ctk.CTkLabel(
                 scroll_frame,
-                width=90,
+                width=CELL_WIDTH,
                 fg_color="#3b3b5c",
                 corner_radius=4,
                 font=HEADER_FONT
-            )
-            _headers.append(lbl)
-
-        lbl.configure(text=f"Col {c + 1}")
-        lbl.grid(row=0, column=c, padx=3, pady=3, sticky="nsew")
-
-    for i in range(cols, len(_headers)):
-        _headers[i].grid_forget()
+            ), None, None, None]
+            _headers.append(entry)
+            # Fixed pixel width (scaled like the CTk header) for the whole column
+            scroll_frame.grid_columnconfigure(
+                c, minsize=round(CELL_WIDTH * ctk.ScalingTracker.get_widget_scaling(app)))
+
+        lbl = entry[0]
+        text = f"Col {c + 1}"
+        if text != entry[1]:
+            lbl.configure(text=text)
+            entry[1] = text
+        if entry[3] != (0, c):
+            lbl.grid(row=0, column=c, padx=3, pady=3, sticky="nsew")
+            entry[3] = (0, c)
+
+    for entry in _headers[cols:]:
+        if entry[3] is not None:
+            entry[0].grid_forget()
+            entry[3] = None
 
     idx = 0
     for r in range(1, rows + 1):
         for c in range(cols):
             if idx < len(_cells):
-                lbl = _cells[idx]
+                entry = _cells[idx]
             else:
-                lbl = ctk.CTkLabel(scroll_frame, width=90, corner_radius=3)
-                _cells.append(lbl)
-
-            lbl.configure(text=f"{r * (c + 1):>6}", fg_color=PALETTE[(r + c) & 1])
-            lbl.grid(row=r, column=c, padx=3, pady=2, sticky="nsew")
+                # Plain tkinter.Label: no per-cell CTk canvas to draw and theme
+                entry = [tkinter.Label(scroll_frame, font=CELL_FONT, fg=CELL_TEXT_COLOR),
+                         None, None, None]
+                _cells.append(entry)
+
+            lbl = entry[0]
+            text = f"{r * (c + 1):>6}"
+            color = PALETTE[(r + c) & 1]
+            if text != entry[1] or color != entry[2]:
+                lbl.configure(text=text, bg=color)
+                entry[1] = text
+                entry[2] = color
+            if entry[3] != (r, c):
+                lbl.grid(row=r, column=c, padx=3, pady=2, sticky="nsew")
+                entry[3] = (r, c)
             idx += 1
 
-    for i in range(idx, len(_cells)):
-        _cells[i].grid_forget()
+    for entry in _cells[idx:]:
+        if entry[3] is not None:
+            entry[0].grid_forget()
+            entry[3] = None
 
 _last_orient = orient_var.get()
 _last_anchor = anchor_var.get()
@@ -125,7 +157,8 @@ def apply_changes():
     orient = orient_var.get()
     anchor = anchor_var.get()
 
-    if orient != _last_orient or anchor != _last_anchor:
+    if orient != _last_orient:
+        # orientation decides which scrollbars exist, so the frame is rebuilt
         scroll_frame.destroy()
 
         scroll_frame = CTkScrollableFrameExt(
@@ -141,13 +174,18 @@ def apply_changes():
         )
         scroll_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
 
-        # 🔥 RESET DO POOL (widgets antigos foram destruídos)
+        # the old frame destroyed the pooled widgets, so start a new pool
         _headers.clear()
         _cells.clear()
 
         _last_orient = orient
         _last_anchor = anchor
 
+    elif anchor != _last_anchor:
+        # anchor changes in place: the widget pool survives
+        scroll_frame.configure(content_anchor=anchor)
+        _last_anchor = anchor
+
     populate()
 
 ctk.CTkButton(controls_frame, text="▶ Apply", command=apply_changes, width=90).pack(side="left")